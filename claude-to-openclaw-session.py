@@ -13,8 +13,9 @@ Fixes over prior versions:
   - Filters local-command noise (<command-name>, <local-command-stdout>, etc.)
   - Auto-detects model from assistant messages (no hardcoded default)
   - Registers session in sessions.json with --register flag
-  - Validates output by re-parsing written JSONL
+  - Validates output by re-parsing written JSONL (with --validate)
   - Proper error handling on I/O
+  - Uses orjson for parsing/serialization when installed (stdlib json otherwise)
 
 Usage:
   python3 claude-to-openclaw-session.py <input.jsonl> [options]
@@ -23,24 +24,38 @@ Options:
   -o, --output <path>    Output JSONL path (default: auto in openclaw sessions dir)
   -s, --session-id <id>  Session ID (default: auto-generated)
   -r, --register         Register session in sessions.json
+  --backup               Keep a timestamped sessions.json.bak.* copy when registering
   -l, --label <text>     Label for the session entry
   --agent <id>           Agent ID (default: main)
   --cwd <path>           Working directory for session header (default: /home/user)
   --dry-run              Print stats without writing
+  --validate             Re-parse the written JSONL to verify integrity
   --filter-commands      Filter out local command noise (default: true)
   --no-filter-commands   Keep local command messages
 """
 
 import argparse
-import hashlib
+import calendar
+import functools
+import itertools
 import json
+import multiprocessing
 import os
+import re
+import shutil
 import sys
 import time
 import uuid
+import zlib
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback
+    orjson = None
+
 # Noise patterns in user messages to filter out
 COMMAND_NOISE = (
     "<command-name>",
@@ -49,18 +64,87 @@ COMMAND_NOISE = (
     "<command-message>",
     "<command-args>",
 )
+_NOISE_RE = re.compile("|".join(map(re.escape, COMMAND_NOISE)))
+
+# Block shapes that are already in OpenClaw form and can be passed through as-is
+_TEXT_KEYS = frozenset(("type", "text"))
+_THINKING_KEYS = frozenset(("type", "thinking", "signature"))
+_TOOL_USE_KEYS = frozenset(("type", "id", "name", "input"))
+
+# Max converted messages held back while waiting for the model to appear
+HEADER_BUFFER_MAX = 256
+
+# Output is written in batches of this many lines through a 1 MiB buffer
+WRITE_BATCH_LINES = 1024
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Parallel conversion: lines per worker batch, and minimum input size to use it
+PARALLEL_BATCH_LINES = 2000
+PARALLEL_MIN_BYTES = 10 * 1024 * 1024
+
+_encode_utf8 = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_encode_ascii = json.JSONEncoder(separators=(",", ":")).encode
+
+# orjson silently decodes integers outside the 64-bit range as floats; any
+# line with a digit run this long (19 covers < -2**63) goes to stdlib instead.
+_BIG_INT_RE = re.compile(rb"\d{19,}")
+
+
+class _NonFiniteFloat(float):
+    """NaN/Infinity read from input; orjson refuses to encode the subclass,
+    so these values go through the stdlib encoder instead of becoming null."""
+
+
+def parse_json(data):
+    """Parse a JSON document from bytes, using orjson when it is lossless."""
+    if orjson is not None and _BIG_INT_RE.search(data) is None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # retry with stdlib, which accepts lone surrogate escapes and NaN
+    return json.loads(data, parse_constant=_NonFiniteFloat)
+
+
+def encode_json(obj):
+    """Serialize to compact UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass  # >64-bit ints, NaN/Infinity, lone surrogates: use stdlib
+    try:
+        return _encode_utf8(obj).encode()
+    except UnicodeEncodeError:
+        # Lone surrogates cannot be UTF-8 encoded: escape them
+        return _encode_ascii(obj).encode()
+
+
+@functools.lru_cache(maxsize=None)
+def home_dir():
+    """Resolve the home directory once, only when a default path needs it."""
+    return Path.home()
 
 
 def short_id(s):
-    """Generate 8-char hex ID from a string."""
-    return hashlib.md5(s.encode()).hexdigest()[:8]
+    """Generate 8-char hex ID from a string (CRC32; not security-sensitive)."""
+    return format(zlib.crc32(s.encode()), "08x")
 
 
 def is_command_noise(content):
     """Check if a string content is local command noise."""
-    if not isinstance(content, str):
+    if not isinstance(content, str) or "<" not in content:
         return False
-    return any(tag in content for tag in COMMAND_NOISE)
+    return _NOISE_RE.search(content) is not None
+
+
+def is_command_noise_any(content):
+    """Check string content or any text block of list content for command noise."""
+    if isinstance(content, list):
+        for block in content:
+            if block.get("type", "text") == "text" and is_command_noise(block.get("text", "")):
+                return True
+        return False
+    return is_command_noise(content)
 
 
 def normalize_content(content):
@@ -78,14 +162,23 @@ def normalize_content(content):
                 text = block.get("text", "")
                 if not text.strip():
                     continue
+                if block.keys() == _TEXT_KEYS:
+                    blocks.append(block)
+                    continue
                 blocks.append({"type": "text", "text": text})
             elif btype == "thinking":
+                if block.keys() == _THINKING_KEYS:
+                    blocks.append(block)
+                    continue
                 blocks.append({
                     "type": "thinking",
                     "thinking": block.get("thinking", ""),
                     "signature": block.get("signature", ""),
                 })
             elif btype == "tool_use":
+                if block.keys() == _TOOL_USE_KEYS:
+                    blocks.append(block)
+                    continue
                 blocks.append({
                     "type": "tool_use",
                     "id": block.get("id", ""),
@@ -116,6 +209,26 @@ def normalize_content(content):
 
 def parse_ts_ms(raw_ts):
     """Parse ISO timestamp to milliseconds since epoch."""
+    # Fast path for Claude Code's fixed YYYY-MM-DDTHH:MM:SS[.sss]Z format
+    # (timegm does not range-check, so anything off goes to the fallback)
+    try:
+        n = len(raw_ts)
+        if (n == 24 and raw_ts[19] == "." or n == 20) and raw_ts[-1] == "Z" \
+                and raw_ts[4] == "-" and raw_ts[7] == "-" and raw_ts[10] == "T" \
+                and raw_ts[13] == ":" and raw_ts[16] == ":":
+            ms = raw_ts[20:23] if n == 24 else "000"
+            digits = (raw_ts[0:4] + raw_ts[5:7] + raw_ts[8:10] + raw_ts[11:13]
+                      + raw_ts[14:16] + raw_ts[17:19] + ms)
+            if digits.isascii() and digits.isdigit():
+                y, mo, d = int(raw_ts[0:4]), int(raw_ts[5:7]), int(raw_ts[8:10])
+                h, mi, s = int(raw_ts[11:13]), int(raw_ts[14:16]), int(raw_ts[17:19])
+                if 1 <= mo <= 12 and 1 <= d <= calendar.monthrange(y, mo)[1] \
+                        and h < 24 and mi < 60 and s < 60:
+                    secs = calendar.timegm((y, mo, d, h, mi, s, 0, 0, 0))
+                    return secs * 1000 + int(ms)
+    except (TypeError, ValueError):
+        pass
+
     try:
         dt = datetime.fromisoformat(raw_ts.replace("Z", "+00:00"))
         return int(dt.timestamp() * 1000)
@@ -127,13 +240,14 @@ def detect_model(input_path):
     """Stream through file to find model and first timestamp without loading all into memory."""
     first_ts = None
     model_id = None
-    with open(input_path) as f:
+    with open(input_path, "rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            # Only parse lines that can still tell us something
+            if not (first_ts is None and b'"timestamp"' in line
+                    or b'"assistant"' in line and b'"model"' in line):
                 continue
             try:
-                d = json.loads(line)
+                d = parse_json(line)
             except json.JSONDecodeError:
                 continue
 
@@ -155,126 +269,222 @@ def detect_model(input_path):
     return first_ts, model_id
 
 
-def convert(input_path, output_path, session_id, cwd, filter_commands):
-    """Stream-convert Claude Code JSONL to OpenClaw JSONL."""
-    first_ts, model_id = detect_model(input_path)
+def convert_record(d, filter_commands, first_ts):
+    """Convert one parsed Claude Code record to an OpenClaw message (None = skip)."""
+    msg_type = d.get("type")
+    if msg_type not in ("user", "assistant"):
+        return None
 
-    provider = "anthropic"
-    if "/" in model_id:
-        provider, model_id = model_id.split("/", 1)
+    if d.get("isMeta"):
+        return None
+
+    msg = d.get("message", {})
+    if not isinstance(msg, dict):
+        return None
+
+    role = msg.get("role")
+    content = msg.get("content")
+    raw_ts = d.get("timestamp", first_ts)
+
+    if role == "user":
+        # Filter local command noise from user messages
+        if filter_commands and is_command_noise_any(content):
+            return None
 
-    id_map = {}
+        norm_content = normalize_content(content)
+        if norm_content is None:
+            return None
 
-    def get_short(uuid_str):
-        if uuid_str not in id_map:
-            id_map[uuid_str] = short_id(uuid_str)
-        return id_map[uuid_str]
+        oc_inner = {
+            "role": "user",
+            "content": norm_content,
+            "timestamp": parse_ts_ms(raw_ts),
+        }
+    elif role == "assistant":
+        norm_content = normalize_content(content)
+        if norm_content is None:
+            return None
+
+        oc_inner = {
+            "role": "assistant",
+            "content": norm_content,
+            "timestamp": parse_ts_ms(raw_ts),
+        }
+        model = msg.get("model")
+        if model:
+            oc_inner["model"] = model
+        api_id = msg.get("id")
+        if api_id:
+            oc_inner["id"] = api_id
+    else:
+        return None
+
+    # Only mint a random UUID when the record really has none
+    msg_uuid = d["uuid"] if "uuid" in d else str(uuid.uuid4())
+    parent_uuid = d.get("parentUuid")
+
+    return {
+        "type": "message",
+        "id": short_id(msg_uuid),
+        "parentId": short_id(parent_uuid) if parent_uuid else None,
+        "timestamp": raw_ts,
+        "message": oc_inner,
+    }
+
+
+def _convert_batch(lines, filter_commands, first_ts):
+    """Worker: parse, convert and encode a batch of raw input lines."""
+    encoded = []
+    skipped = 0
+    errors = 0
+    for line in lines:
+        if len(line) <= 1:  # blank line
+            continue
+        try:
+            d = parse_json(line)
+        except json.JSONDecodeError:
+            if line.strip():
+                errors += 1
+            continue
+        oc_message = convert_record(d, filter_commands, first_ts)
+        if oc_message is None:
+            skipped += 1
+        else:
+            encoded.append(encode_json(oc_message))
+    return encoded, skipped, errors
+
+
+def convert(input_path, output_path, session_id, cwd, filter_commands,
+            parallel=False):
+    """Stream-convert Claude Code JSONL to OpenClaw JSONL in a single pass.
+
+    The session header needs the model and first timestamp, so converted
+    messages are held back until the first assistant message names the model
+    (or HEADER_BUFFER_MAX messages are pending, or EOF), then the header and
+    the held-back messages are written and the rest streams straight through.
+
+    With parallel=True, everything after the header is converted in worker
+    processes, PARALLEL_BATCH_LINES lines at a time, and written in order.
+    """
+    if (os.cpu_count() or 1) < 2:
+        parallel = False
+    first_ts = None
+    model_id = None
+    provider = "anthropic"
+    pending = []   # converted messages waiting on the header
+    undated = []   # pending messages that inherit first_ts once it is known
+    header_written = False
+    batch = []     # encoded lines not yet handed to the file
+    enc = encode_json
 
     converted = 0
     skipped = 0
     errors = 0
 
-    with open(output_path, "w") as out:
-        # Session header
-        out.write(json.dumps({
-            "type": "session",
-            "version": 3,
-            "id": session_id,
-            "timestamp": first_ts,
-            "cwd": cwd,
-            "model": f"{provider}/{model_id}",
-        }) + "\n")
-
-        # Model change event
-        out.write(json.dumps({
-            "type": "model_change",
-            "id": short_id(session_id + "_model"),
-            "parentId": None,
-            "timestamp": first_ts,
-            "provider": provider,
-            "modelId": model_id,
-        }) + "\n")
+    with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as out:
+
+        def flush_batch():
+            if batch:
+                out.write(b"\n".join(batch) + b"\n")
+                batch.clear()
+
+        def write_header():
+            nonlocal first_ts, model_id, provider
+            if first_ts is None:
+                first_ts = datetime.now(timezone.utc).isoformat()
+            if model_id is None:
+                model_id = "claude-opus-4-6"
+            if "/" in model_id:
+                provider, model_id = model_id.split("/", 1)
+
+            # Session header and model change event, filled into a fixed
+            # template; only the caller/input-supplied strings are encoded.
+            ts = enc(first_ts)
+            batch.append(
+                b'{"type":"session","version":3,"id":%s,"timestamp":%s,'
+                b'"cwd":%s,"model":%s}\n'
+                b'{"type":"model_change","id":"%s","parentId":null,"timestamp":%s,'
+                b'"provider":%s,"modelId":%s}' % (
+                    enc(session_id), ts, enc(cwd), enc(f"{provider}/{model_id}"),
+                    short_id(session_id + "_model").encode(), ts,
+                    enc(provider), enc(model_id),
+                )
+            )
+
+            for oc_message in undated:
+                oc_message["timestamp"] = first_ts
+                oc_message["message"]["timestamp"] = parse_ts_ms(first_ts)
+            batch.extend(enc(m) for m in pending)
+            pending.clear()
+            undated.clear()
 
         # Stream input
-        with open(input_path) as inp:
+        with open(input_path, "rb") as inp:
             for line in inp:
-                line = line.strip()
-                if not line:
+                if len(line) <= 1:  # blank line
                     continue
                 try:
-                    d = json.loads(line)
+                    d = parse_json(line)
                 except json.JSONDecodeError:
-                    errors += 1
-                    continue
-
-                msg_type = d.get("type")
-                if msg_type not in ("user", "assistant"):
-                    skipped += 1
-                    continue
-
-                if d.get("isMeta"):
-                    skipped += 1
-                    continue
-
-                msg = d.get("message", {})
-                if not isinstance(msg, dict):
-                    skipped += 1
+                    if line.strip():  # whitespace-only lines are not errors
+                        errors += 1
                     continue
 
-                role = msg.get("role")
-                content = msg.get("content")
-
-                if role not in ("user", "assistant"):
+                if not header_written:
+                    ts = d.get("timestamp")
+                    if ts and first_ts is None:
+                        first_ts = ts
+                    if d.get("type") == "assistant" and isinstance(d.get("message"), dict):
+                        model_id = d["message"].get("model") or None
+                    if model_id is None and len(pending) >= HEADER_BUFFER_MAX:
+                        # Model still unknown: fall back to a pre-scan
+                        first_ts, model_id = detect_model(input_path)
+                    if model_id is not None:
+                        write_header()
+                        header_written = True
+
+                oc_message = convert_record(d, filter_commands, first_ts)
+                if oc_message is None:
                     skipped += 1
-                    continue
-
-                # Filter local command noise from user messages
-                if filter_commands and role == "user" and isinstance(content, str):
-                    if is_command_noise(content):
-                        skipped += 1
-                        continue
-
-                norm_content = normalize_content(content)
-                if norm_content is None:
-                    skipped += 1
-                    continue
+                elif header_written:
+                    batch.append(enc(oc_message))
+                    converted += 1
+                    if len(batch) >= WRITE_BATCH_LINES:
+                        flush_batch()
+                else:
+                    if "timestamp" not in d and first_ts is None:
+                        undated.append(oc_message)
+                    pending.append(oc_message)
+                    converted += 1
+
+                if parallel and header_written:
+                    break
 
-                # If after normalization, all text blocks are command noise, skip
-                if filter_commands and role == "user":
-                    text_only = " ".join(
-                        b.get("text", "") for b in norm_content if b.get("type") == "text"
-                    )
-                    if is_command_noise(text_only):
-                        skipped += 1
-                        continue
-
-                raw_ts = d.get("timestamp", first_ts)
-                msg_uuid = d.get("uuid", str(uuid.uuid4()))
-                parent_uuid = d.get("parentUuid")
-
-                short = get_short(msg_uuid)
-                parent_short = get_short(parent_uuid) if parent_uuid else None
-
-                oc_message = {
-                    "type": "message",
-                    "id": short,
-                    "parentId": parent_short,
-                    "timestamp": raw_ts,
-                    "message": {
-                        "role": role,
-                        "content": norm_content,
-                        "timestamp": parse_ts_ms(raw_ts),
-                    },
-                }
-
-                if role == "assistant":
-                    if msg.get("model"):
-                        oc_message["message"]["model"] = msg["model"]
-                    if msg.get("id"):
-                        oc_message["message"]["id"] = msg["id"]
-
-                out.write(json.dumps(oc_message) + "\n")
-                converted += 1
+            if parallel and header_written:
+                # Keep a bounded number of batches in flight so the input is
+                # never read into memory ahead of the writer.
+                flush_batch()
+                max_inflight = 2 * (os.cpu_count() or 1)
+                inflight = deque()
+                with multiprocessing.Pool() as pool:
+                    while True:
+                        lines = list(itertools.islice(inp, PARALLEL_BATCH_LINES))
+                        if lines:
+                            inflight.append(pool.apply_async(
+                                _convert_batch, (lines, filter_commands, first_ts)))
+                        if inflight and (not lines or len(inflight) >= max_inflight):
+                            encoded, n_skipped, n_errors = inflight.popleft().get()
+                            if encoded:
+                                out.write(b"\n".join(encoded) + b"\n")
+                            converted += len(encoded)
+                            skipped += n_skipped
+                            errors += n_errors
+                        elif not lines:
+                            break
+
+        if not header_written:
+            write_header()
+        flush_batch()
 
     return converted, skipped, errors, first_ts, model_id
 
@@ -282,20 +492,22 @@ def convert(input_path, output_path, session_id, cwd, filter_commands):
 def validate_output(output_path):
     """Re-parse written JSONL to verify integrity."""
     count = 0
-    with open(output_path) as f:
-        for i, line in enumerate(f, 1):
+    loads = parse_json
+    with open(output_path, "rb") as f:
+        for line in f:
             try:
-                json.loads(line.strip())
-                count += 1
+                loads(line)
             except json.JSONDecodeError as e:
-                print(f"  VALIDATION ERROR line {i}: {e}", file=sys.stderr)
+                print(f"  VALIDATION ERROR line {count + 1}: {e}", file=sys.stderr)
                 return False, count
+            count += 1
     return True, count
 
 
-def register_session(session_id, output_path, agent_id, label, model_id, first_ts):
+def register_session(session_id, output_path, agent_id, label, model_id, first_ts,
+                     backup=False):
     """Register the converted session in openclaw sessions.json."""
-    state_dir = Path.home() / ".openclaw" / "agents" / agent_id / "sessions"
+    state_dir = home_dir() / ".openclaw" / "agents" / agent_id / "sessions"
     store_path = state_dir / "sessions.json"
 
     if not store_path.exists():
@@ -303,14 +515,21 @@ def register_session(session_id, output_path, agent_id, label, model_id, first_t
         return False
 
     try:
-        with open(store_path) as f:
-            store = json.load(f)
+        # stdlib json: must not alter other entries (orjson floats big ints)
+        nonfinite = []
+
+        def parse_constant(c):
+            nonfinite.append(c)
+            return float(c)
+
+        with open(store_path, encoding="utf-8") as f:
+            store = json.load(f, parse_constant=parse_constant)
     except (json.JSONDecodeError, OSError) as e:
         print(f"  ERROR reading sessions.json: {e}", file=sys.stderr)
         return False
 
     session_key = f"agent:{agent_id}:claude-code-import"
-    abs_output = str(Path(output_path).resolve())
+    abs_output = os.path.abspath(output_path)
 
     store[session_key] = {
         "sessionId": session_id,
@@ -329,15 +548,38 @@ def register_session(session_id, output_path, agent_id, label, model_id, first_t
         "label": label or f"Claude Code import ({session_id})",
     }
 
-    # Atomic write with backup
-    bak = str(store_path) + f".bak.{int(time.time())}"
+    if backup:
+        bak = str(store_path) + f".bak.{int(time.time())}"
+        try:
+            shutil.copyfile(store_path, bak)
+        except OSError as e:
+            print(f"  WARN: could not back up sessions.json: {e}", file=sys.stderr)
+
+    # orjson writes NaN/Infinity as null, so only use it when none were read
+    data = None
+    if orjson is not None and not nonfinite:
+        try:
+            data = orjson.dumps(store, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # lone surrogates or >64-bit ints: let stdlib write them
+    if data is None:
+        data = json.dumps(store, indent=2).encode()
+
+    # Atomic write: sessions.json is never missing or half-written
+    tmp = str(store_path) + ".tmp"
     try:
-        os.rename(store_path, bak)
-    except OSError:
-        pass
-
-    with open(store_path, "w") as f:
-        json.dump(store, f, indent=2)
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, store_path)
+    except OSError as e:
+        print(f"  ERROR writing sessions.json: {e}", file=sys.stderr)
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return False
 
     print(f"  Registered as '{session_key}' in {store_path}")
     return True
@@ -352,12 +594,16 @@ def main():
     parser.add_argument("-s", "--session-id", help="Session ID (default: auto)")
     parser.add_argument("-r", "--register", action="store_true",
                         help="Register in sessions.json")
+    parser.add_argument("--backup", action="store_true",
+                        help="Keep a timestamped copy of sessions.json when registering")
     parser.add_argument("-l", "--label", help="Session label")
     parser.add_argument("--agent", default="main", help="Agent ID (default: main)")
     parser.add_argument("--cwd", default="/home/user",
                         help="Working directory for session header")
     parser.add_argument("--dry-run", action="store_true",
                         help="Print stats without writing")
+    parser.add_argument("--validate", action="store_true",
+                        help="Re-parse the written JSONL to verify integrity")
     parser.add_argument("--no-filter-commands", action="store_true",
                         help="Keep local command messages")
 
@@ -373,17 +619,21 @@ def main():
         args.session_id = str(uuid.uuid4())
 
     if args.output is None:
-        sessions_dir = Path.home() / ".openclaw" / "agents" / args.agent / "sessions"
+        sessions_dir = home_dir() / ".openclaw" / "agents" / args.agent / "sessions"
         sessions_dir.mkdir(parents=True, exist_ok=True)
         args.output = str(sessions_dir / f"{args.session_id}.jsonl")
 
     input_path = Path(args.input)
-    if not input_path.exists():
+    try:
+        st = os.stat(input_path)
+    except OSError:  # missing, or a path component is not a directory
         print(f"ERROR: input file not found: {input_path}", file=sys.stderr)
         sys.exit(1)
 
-    input_size = input_path.stat().st_size
-    print(f"Input:     {input_path} ({input_size / 1024 / 1024:.1f} MB)")
+    # The single stat of the input feeds both the size report and the
+    # serial/parallel decision.
+    use_parallel = st.st_size >= PARALLEL_MIN_BYTES
+    print(f"Input:     {input_path} ({st.st_size / 1024 / 1024:.1f} MB)")
     print(f"SessionID: {args.session_id}")
 
     if args.dry_run:
@@ -400,6 +650,7 @@ def main():
         args.session_id,
         args.cwd,
         not args.no_filter_commands,
+        parallel=use_parallel,
     )
 
     output_size = Path(args.output).stat().st_size
@@ -411,12 +662,13 @@ def main():
     print(f"Output:    {args.output} ({output_size / 1024:.1f} KB)")
 
     # Validate
-    valid, count = validate_output(args.output)
-    if valid:
-        print(f"Validated: {count} valid JSONL lines")
-    else:
-        print(f"VALIDATION FAILED at line {count + 1}", file=sys.stderr)
-        sys.exit(1)
+    if args.validate:
+        valid, count = validate_output(args.output)
+        if valid:
+            print(f"Validated: {count} valid JSONL lines")
+        else:
+            print(f"VALIDATION FAILED at line {count + 1}", file=sys.stderr)
+            sys.exit(1)
 
     # Register
     if args.register:
@@ -427,6 +679,7 @@ def main():
             args.label,
             model_id,
             first_ts,
+            backup=args.backup,
         )
 
     print("Done.")
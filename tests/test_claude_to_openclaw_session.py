@@ -0,0 +1,247 @@
+"""Tests for claude-to-openclaw-session.py."""
+
+import importlib.util
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "claude-to-openclaw-session.py"
+_spec = importlib.util.spec_from_file_location("claude_to_openclaw_session", _SCRIPT)
+c2o = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = c2o  # lets worker processes unpickle its functions
+_spec.loader.exec_module(c2o)
+
+
+class ParseTsMsTest(unittest.TestCase):
+
+    def test_claude_code_format(self):
+        self.assertEqual(c2o.parse_ts_ms("2024-02-29T01:02:03.456Z"), 1709168523456)
+        self.assertEqual(c2o.parse_ts_ms("2025-01-01T00:00:00Z"), 1735689600000)
+
+    def test_out_of_range_fields_are_rejected(self):
+        for raw_ts in (
+            "2025-01-32T00:00:00.000Z",
+            "2025-02-30T10:00:00Z",
+            "2025-01-01T24:00:00.000Z",
+            "2025-01-01T00:00:60Z",
+            "2025-01-01T00:00:00.+12Z",
+        ):
+            self.assertEqual(c2o.parse_ts_ms(raw_ts), 0, raw_ts)
+
+
+class JsonCodecTest(unittest.TestCase):
+
+    def test_non_finite_floats_are_not_nulled(self):
+        data = c2o.encode_json(c2o.parse_json(b'{"x": NaN, "y": -Infinity, "z": "\xc3\xa9"}'))
+        self.assertEqual(data, b'{"x":NaN,"y":-Infinity,"z":"\xc3\xa9"}')
+
+
+def _user(n, **extra):
+    record = {
+        "type": "user",
+        "uuid": f"u{n}",
+        "message": {"role": "user", "content": f"message {n}"},
+    }
+    record.update(extra)
+    return record
+
+
+def _assistant(n, model="claude-sonnet-4-5", **extra):
+    record = {
+        "type": "assistant",
+        "uuid": f"a{n}",
+        "message": {"role": "assistant", "model": model, "content": f"reply {n}"},
+    }
+    record.update(extra)
+    return record
+
+
+class ConvertTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def convert(self, records):
+        input_path = os.path.join(self.tmp.name, "in.jsonl")
+        output_path = os.path.join(self.tmp.name, "out.jsonl")
+        with open(input_path, "w") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        c2o.convert(input_path, output_path, "sess", "/home/user", True)
+        with open(output_path, encoding="utf-8") as f:
+            return [json.loads(line) for line in f]
+
+    def test_undated_records_get_first_timestamp(self):
+        first_ts = "2025-03-04T05:06:07.089Z"
+        lines = self.convert([
+            _user(0),
+            _user(1, timestamp=first_ts),
+            _assistant(2, timestamp="2025-03-04T05:07:00.000Z"),
+        ])
+        self.assertEqual(lines[0]["timestamp"], first_ts)
+        undated = lines[2]
+        self.assertEqual(undated["message"]["content"][0]["text"], "message 0")
+        self.assertEqual(undated["timestamp"], first_ts)
+        self.assertEqual(undated["message"]["timestamp"], c2o.parse_ts_ms(first_ts))
+
+    def test_late_model_reaches_header_via_prescan(self):
+        count = c2o.HEADER_BUFFER_MAX + 10
+        records = [_user(n, timestamp="2025-01-01T00:00:00Z") for n in range(count)]
+        records.append(_assistant(count, model="vendor/late-model"))
+        with mock.patch.object(c2o, "detect_model", wraps=c2o.detect_model) as prescan:
+            lines = self.convert(records)
+        prescan.assert_called_once()
+        self.assertEqual(lines[0]["model"], "vendor/late-model")
+        self.assertEqual(lines[1]["provider"], "vendor")
+        self.assertEqual(lines[1]["modelId"], "late-model")
+        texts = [line["message"]["content"][0]["text"] for line in lines[2:]]
+        self.assertEqual(texts, [f"message {n}" for n in range(count)] + [f"reply {count}"])
+
+    def test_missing_assistant_uses_default_model(self):
+        lines = self.convert([_user(0, timestamp="2025-01-01T00:00:00Z")])
+        self.assertEqual(lines[0]["model"], "anthropic/claude-opus-4-6")
+        self.assertEqual(lines[1]["modelId"], "claude-opus-4-6")
+        self.assertEqual(len(lines), 3)
+
+    def test_big_ints_round_trip_exactly(self):
+        big = [10 ** 30, -(2 ** 63) - 1, 2 ** 64]
+        lines = self.convert([{
+            "type": "assistant",
+            "uuid": "a",
+            "timestamp": "2025-01-01T00:00:00.000Z",
+            "message": {
+                "role": "assistant",
+                "model": "claude-sonnet-4-5",
+                "content": [{"type": "tool_use", "id": "t", "name": "Bash",
+                             "input": {"n": big}}],
+            },
+        }])
+        self.assertEqual(lines[2]["message"]["content"][0]["input"]["n"], big)
+        self.assertTrue(all(type(n) is int
+                            for n in lines[2]["message"]["content"][0]["input"]["n"]))
+
+
+class ParallelConvertTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_parallel_output_matches_serial(self):
+        input_path = os.path.join(self.tmp.name, "in.jsonl")
+        with open(input_path, "w") as f:
+            f.write(json.dumps(_user(-1)) + "\n")  # undated, before the header
+            for n in range(300):
+                ts = f"2025-01-01T00:{n // 60:02d}:{n % 60:02d}.000Z"
+                if n % 3:
+                    f.write(json.dumps(_user(n, timestamp=ts, parentUuid=f"a{n - 1}")) + "\n")
+                else:
+                    f.write(json.dumps(_assistant(n, timestamp=ts)) + "\n")
+                if n % 17 == 0:
+                    f.write("not json {\n")
+                if n % 23 == 0:
+                    f.write("\n   \n")
+                if n % 29 == 0:
+                    f.write(json.dumps({"type": "progress", "timestamp": ts}) + "\n")
+                if n % 31 == 0:
+                    noise = _user(n, timestamp=ts)
+                    noise["message"]["content"] = "<command-name>/clear</command-name>"
+                    f.write(json.dumps(noise) + "\n")
+
+        results = {}
+        for parallel in (False, True):
+            output_path = os.path.join(self.tmp.name, f"out-{parallel}.jsonl")
+            with mock.patch("os.cpu_count", return_value=4), \
+                    mock.patch.object(c2o, "PARALLEL_BATCH_LINES", 7), \
+                    mock.patch.object(c2o.multiprocessing, "Pool",
+                                      wraps=c2o.multiprocessing.Pool) as pool:
+                counts = c2o.convert(input_path, output_path, "sess", "/home/user",
+                                     True, parallel=parallel)
+            self.assertEqual(pool.called, parallel)
+            with open(output_path, "rb") as f:
+                results[parallel] = (f.read(), counts)
+
+        serial, parallel = results[False], results[True]
+        self.assertEqual(parallel[0], serial[0])
+        self.assertEqual(parallel[1][:3], serial[1][:3])
+        self.assertGreater(serial[1][1], 0)
+        self.assertGreater(serial[1][2], 0)
+
+
+class MainTest(unittest.TestCase):
+
+    def test_convert_without_home_directory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, "in.jsonl")
+            output_path = os.path.join(tmp, "out.jsonl")
+            with open(input_path, "w") as f:
+                f.write(json.dumps(_assistant(0, timestamp="2025-01-01T00:00:00Z")) + "\n")
+            argv = ["prog", input_path, "-o", output_path, "-s", "sess"]
+            with mock.patch.object(sys, "argv", argv), \
+                    mock.patch.object(Path, "home", side_effect=RuntimeError), \
+                    mock.patch("sys.stdout"):
+                # Import afresh too: nothing at module level may need home
+                spec = importlib.util.spec_from_file_location("c2o_no_home", _SCRIPT)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                module.main()
+            self.assertTrue(os.path.exists(output_path))
+
+    def test_unstattable_input_is_reported(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_file = os.path.join(tmp, "file.jsonl")
+            open(input_file, "w").close()
+            for input_path in (os.path.join(tmp, "missing.jsonl"),
+                               os.path.join(input_file, "x")):
+                argv = ["prog", input_path, "-o", os.path.join(tmp, "out.jsonl")]
+                with mock.patch.object(sys, "argv", argv), \
+                        mock.patch("sys.stderr", new_callable=io.StringIO) as stderr, \
+                        self.assertRaises(SystemExit) as cm:
+                    c2o.main()
+                self.assertEqual(cm.exception.code, 1)
+                self.assertIn("ERROR: input file not found", stderr.getvalue())
+
+
+class RegisterSessionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        home = Path(self.tmp.name)
+        self.store_path = home / ".openclaw" / "agents" / "main" / "sessions" / "sessions.json"
+        self.store_path.parent.mkdir(parents=True)
+        patcher = mock.patch.object(c2o, "home_dir", return_value=home)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def register(self, existing):
+        self.store_path.write_text(existing, encoding="utf-8")
+        ok = c2o.register_session("sess", "out.jsonl", "main", None,
+                                  "claude-sonnet-4-5", "2025-01-01T00:00:00Z")
+        self.assertTrue(ok)
+        return json.loads(self.store_path.read_text(encoding="utf-8"))
+
+    def test_existing_entries_are_preserved(self):
+        existing = {
+            "other": {"big": 123456789012345678901234, "neg": -(2 ** 63) - 1,
+                      "label": "caf\u00e9 \u2603", "ratio": 0.1},
+        }
+        store = self.register(json.dumps(existing, ensure_ascii=False))
+        self.assertEqual(store["other"], existing["other"])
+        self.assertIs(type(store["other"]["big"]), int)
+        self.assertEqual(store["agent:main:claude-code-import"]["sessionId"], "sess")
+
+    def test_non_finite_floats_are_preserved(self):
+        store = self.register('{"other": {"x": NaN, "y": Infinity}}')
+        self.assertNotEqual(store["other"]["x"], store["other"]["x"])
+        self.assertEqual(store["other"]["y"], float("inf"))
+
+
+if __name__ == "__main__":
+    unittest.main()